@@ -3,26 +3,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import subprocess
-import tempfile
+import hashlib
 import os
 import io
-from PIL import Image, ImageDraw, ImageFont
-import warnings
+import logging
 from config import load_environment
-from data_processing import DataProcessor
-from visualizations import Visualizer
-from animations import AnimationGenerator
-from text_analysis import TextAnalyzer
-from data_cleaning import DataCleaner
-from video_generator import VideoGenerator
-from presentation_generator import PresentationGenerator
 from styles import STYLES, get_style
 
+logger = logging.getLogger(__name__)
+
+# Heavy modules (matplotlib, groq, python-pptx, ...) are imported inside the
+# getter functions below, so cold start only pays for what a page uses
+
 # Must be the first Streamlit command
 st.set_page_config(
     page_title="Data Analysis Suite",
@@ -31,9 +23,6 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Suppress warnings
-warnings.filterwarnings('ignore')
-
 # Constants
 CHART_TYPES = {
     'Line Plot': 'line',
@@ -45,22 +34,121 @@ CHART_TYPES = {
     'Heatmap': 'heatmap'
 }
 
+# Full-frame fingerprint for cache_data: hash_pandas_object runs at
+# memory bandwidth, and anything less - a head() sample, an
+# order-insensitive sum - lets frames that differ past the sample
+# collide and serve stale cached results
+_DF_HASH_FUNCS = {
+    pd.DataFrame: lambda d: (
+        tuple(d.columns),
+        hashlib.blake2b(
+            pd.util.hash_pandas_object(d, index=True).to_numpy().tobytes(),
+            digest_size=16
+        ).digest()
+    )
+}
+
+@st.cache_data(show_spinner=False)
+def _read_cached(name: str, data: bytes) -> pd.DataFrame:
+    """Parse an uploaded file once per unique name/content pair"""
+    buffer = io.BytesIO(data)
+    buffer.name = name
+    return st.session_state.data_processor.read_file(buffer)
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _describe(df: pd.DataFrame) -> pd.DataFrame:
+    """Cached df.describe() so repeated page views skip the recompute"""
+    return df.describe()
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _corr(df: pd.DataFrame) -> pd.DataFrame:
+    """Cached correlation matrix keyed on the DataFrame fingerprint"""
+    arr = df.to_numpy(dtype=np.float64, copy=False)
+    if df.shape[1] > 1 and not np.isnan(arr).any():
+        # One BLAS-backed pass instead of pandas' per-pair computation
+        corr = np.corrcoef(arr, rowvar=False)
+        return pd.DataFrame(corr, index=df.columns, columns=df.columns)
+    # pandas handles NaNs pairwise, so keep it for incomplete data
+    return df.corr()
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _preview(df: pd.DataFrame):
+    """Cached 10-row preview, pre-converted to Arrow for st.dataframe"""
+    import pyarrow as pa
+    # st.dataframe converts to Arrow internally anyway; caching the Table
+    # means reruns skip the pandas-to-Arrow conversion entirely
+    return pa.Table.from_pandas(df.head(10), preserve_index=False)
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _cached_figure(df: pd.DataFrame, chart_type: str, title: str, style_name: str):
+    """Build a Plotly figure once per data/chart/style combination"""
+    return _visualizer(style_name).create_visualization(df, chart_type, title)
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _numeric_cols(df: pd.DataFrame) -> list:
+    """Cached list of numeric columns, covering all numeric dtypes"""
+    return list(df.select_dtypes(include=[np.number]).columns)
+
+@st.cache_resource
+def _data_processor():
+    """Shared DataProcessor instance across sessions"""
+    from data_processing import DataProcessor
+    return DataProcessor()
+
+# Not cache_resource: these three carry per-call state on the instance
+# (DataCleaner keeps the frame being cleaned, the video/presentation
+# generators take style/quality mutations before create_*), so sharing
+# one instance across sessions would race concurrent users
+
+def _data_cleaner():
+    """Per-session DataCleaner instance"""
+    from data_cleaning import DataCleaner
+    return DataCleaner()
+
+def _video_generator():
+    """Per-session VideoGenerator instance"""
+    from video_generator import VideoGenerator
+    return VideoGenerator()
+
+def _presentation_generator():
+    """Per-session PresentationGenerator instance"""
+    from presentation_generator import PresentationGenerator
+    return PresentationGenerator()
+
+@st.cache_resource
+def _text_analyzer(api_key: str):
+    """Shared TextAnalyzer instance, keyed by API key"""
+    from text_analysis import TextAnalyzer
+    return TextAnalyzer(api_key)
+
+@st.cache_resource
+def _visualizer(style_name: str):
+    """Visualizer instance cached per style name"""
+    from visualizations import Visualizer
+    return Visualizer(get_style(style_name))
+
+@st.cache_resource
+def _animation_generator(style_name: str):
+    """AnimationGenerator instance cached per style name"""
+    from animations import AnimationGenerator
+    return AnimationGenerator(get_style(style_name))
+
 def initialize_session_state():
     """Initialize session state variables"""
     if 'initialized' not in st.session_state:
         st.session_state.initialized = True
-        st.session_state.data_processor = DataProcessor()
+        st.session_state.data_processor = _data_processor()
         st.session_state.visualizer = None
         st.session_state.animation_generator = None
-        st.session_state.data_cleaner = DataCleaner()
-        st.session_state.video_generator = VideoGenerator()
-        st.session_state.presentation_generator = PresentationGenerator()
+        st.session_state.data_cleaner = _data_cleaner()
+        st.session_state.video_generator = _video_generator()
+        st.session_state.presentation_generator = _presentation_generator()
         # Add new session state variables for file handling
         st.session_state.uploaded_file = None
         st.session_state.processed_data = None
         try:
             api_key = os.getenv('GROQ_API_KEY')
-            st.session_state.analyzer = TextAnalyzer(api_key)
+            st.session_state.analyzer = _text_analyzer(api_key)
         except Exception as e:
             st.error(f"Error initializing Text Analyzer: {e}")
             st.session_state.analyzer = None
@@ -72,13 +160,10 @@ def handle_file_upload():
         type=['csv', 'xlsx', 'xls']
     )
 
-    if uploaded_file is not None and (
-        st.session_state.uploaded_file is None or 
-        uploaded_file.name != st.session_state.uploaded_file.name
-    ):
+    if uploaded_file is not None:
         try:
-            # Process new file
-            df = st.session_state.data_processor.read_file(uploaded_file)
+            # Parse is cached on name+bytes, so reruns with the same file are free
+            df = _read_cached(uploaded_file.name, uploaded_file.getvalue())
             if df is not None:
                 st.session_state.uploaded_file = uploaded_file
                 st.session_state.processed_data = df
@@ -133,6 +218,7 @@ def display_home():
     4. Generate insights and visualizations
     """)
 
+@st.fragment
 def display_presentation_generator(style: dict):
     """Display presentation generator page"""
     st.title("📊 Presentation Generator")
@@ -140,12 +226,12 @@ def display_presentation_generator(style: dict):
     if handle_file_upload():
         df = st.session_state.processed_data
         st.write("### Data Preview")
-        st.dataframe(df.head())
+        st.dataframe(_preview(df), use_container_width=True)
 
         col1, col2 = st.columns(2)
         
         with col1:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
+            numeric_cols = _numeric_cols(df)
             selected_cols = st.multiselect(
                 "Select columns for analysis",
                 numeric_cols
@@ -182,11 +268,13 @@ def display_presentation_generator(style: dict):
             if st.button("Generate Presentation"):
                 with st.spinner("Creating presentation..."):
                     try:
+                        generator = st.session_state.presentation_generator
+
                         # Update style
-                        st.session_state.presentation_generator.update_style(style)
-                        
+                        generator.update_style(style)
+
                         # Generate presentation
-                        pptx_bytes = st.session_state.presentation_generator.create_presentation(
+                        pptx_stream = generator.create_presentation(
                             df[selected_cols],
                             selected_cols,
                             selected_charts,
@@ -196,12 +284,12 @@ def display_presentation_generator(style: dict):
                             include_conclusions=include_conclusions
                         )
                         
-                        if pptx_bytes:
+                        if pptx_stream:
                             st.success("✨ Presentation generated successfully!")
-                            
+
                             st.download_button(
                                 "⬇ Download Presentation",
-                                data=pptx_bytes,
+                                data=pptx_stream,
                                 file_name=f"{presentation_title.lower().replace(' ', '_')}.pptx",
                                 mime="application/vnd.openxmlformats-officedocument.presentationml.presentation"
                             )
@@ -209,8 +297,10 @@ def display_presentation_generator(style: dict):
                             st.error("Failed to generate presentation")
                             
                     except Exception as e:
+                        # Rendering the traceback in-browser would repr frame
+                        # locals, including the full DataFrame
+                        logger.exception("Error generating presentation")
                         st.error(f"Error generating presentation: {str(e)}")
-                        st.exception(e)
         else:
             st.warning("Please select at least one column and one chart type")
             
@@ -221,7 +311,7 @@ def display_data_analysis(style: dict):
     if handle_file_upload():
         df = st.session_state.processed_data
         st.write("### Data Preview")
-        st.dataframe(df.head())
+        st.dataframe(_preview(df), use_container_width=True)
 
         # Analysis options
         analysis_type = st.selectbox(
@@ -231,37 +321,41 @@ def display_data_analysis(style: dict):
 
         if analysis_type == "Statistical Summary":
             st.write("### Statistical Summary")
-            st.write(df.describe())
+            st.write(_describe(df))
 
         elif analysis_type == "Correlation Analysis":
             st.write("### Correlation Analysis")
-            numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+            numeric_cols = _numeric_cols(df)
             if len(numeric_cols) > 1:
-                correlation_matrix = df[numeric_cols].corr()
-                fig = st.session_state.visualizer.create_visualization(
+                correlation_matrix = _corr(df[numeric_cols])
+                fig = _cached_figure(
                     correlation_matrix,
                     'Heatmap',
-                    "Correlation Matrix"
+                    "Correlation Matrix",
+                    st.session_state.style_name
                 )
-                st.plotly_chart(fig)
+                # Stable key lets the front end diff and skip retransmission
+                st.plotly_chart(fig, key='corr_heatmap', use_container_width=True)
             else:
                 st.warning("Need at least two numeric columns for correlation analysis")
 
         elif analysis_type == "Distribution Analysis":
             st.write("### Distribution Analysis")
             selected_column = st.selectbox("Select column:", df.columns)
-            fig = st.session_state.visualizer.create_visualization(
+            fig = _cached_figure(
                 df[[selected_column]],
                 'Box Plot',
-                f"Distribution of {selected_column}"
+                f"Distribution of {selected_column}",
+                st.session_state.style_name
             )
-            st.plotly_chart(fig)
+            st.plotly_chart(fig, key='distribution_box', use_container_width=True)
 
 def display_text_analysis(style: dict):
     """Display text analysis page"""
     st.title("📝 Text Analysis & Visualization")
     
-    if st.session_state.analyzer is None:
+    analyzer = st.session_state.analyzer
+    if analyzer is None:
         st.error("Text Analyzer not initialized. Please check your API key.")
         return
 
@@ -283,22 +377,24 @@ def display_text_analysis(style: dict):
             help="Upload a .txt file containing numerical data"
         )
         if uploaded_file:
-            user_text = uploaded_file.getvalue().decode('utf-8')
+            # Streamed decode avoids keeping a second full copy of the raw
+            # bytes alive alongside the decoded string
+            user_text = io.TextIOWrapper(uploaded_file, encoding='utf-8', errors='replace').read()
         else:
             user_text = None
 
     if user_text:
         selected_chart = st.selectbox(
             "Select Chart Type",
-            list(st.session_state.analyzer.chart_types.keys())
+            list(analyzer.chart_types.keys())
         )
 
         if st.button("Analyze Text"):
             with st.spinner("Analyzing text..."):
                 try:
-                    data = st.session_state.analyzer.extract_data(user_text)
+                    data = analyzer.extract_data(user_text)
                     if data:
-                        fig = st.session_state.analyzer.create_visualization(
+                        fig = analyzer.create_visualization(
                             data,
                             selected_chart,
                             style=style
@@ -307,6 +403,7 @@ def display_text_analysis(style: dict):
                 except Exception as e:
                     st.error(f"Error analyzing text: {str(e)}")
 
+@st.fragment
 def display_animation_generator(style: dict):
     """Display animation generator page"""
     st.title("🎬 Animation Generator")
@@ -314,10 +411,10 @@ def display_animation_generator(style: dict):
     if handle_file_upload():
         df = st.session_state.processed_data
         st.write("### Data Preview")
-        st.dataframe(df.head())
+        st.dataframe(_preview(df), use_container_width=True)
 
         # Animation options
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+        numeric_cols = _numeric_cols(df)
         selected_cols = st.multiselect(
             "Select columns for animation:",
             numeric_cols,
@@ -351,6 +448,7 @@ def display_animation_generator(style: dict):
                     except Exception as e:
                         st.error(f"Error creating animation: {str(e)}")
 
+@st.fragment
 def display_video_generator(style: dict):
     """Display video generator page"""
     st.title("🎥 Video Generator")
@@ -358,12 +456,12 @@ def display_video_generator(style: dict):
     if handle_file_upload():
         df = st.session_state.processed_data
         st.write("### Data Preview")
-        st.dataframe(df.head())
+        st.dataframe(_preview(df), use_container_width=True)
 
         col1, col2 = st.columns(2)
         
         with col1:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
+            numeric_cols = _numeric_cols(df)
             selected_cols = st.multiselect(
                 "Select columns for visualization",
                 numeric_cols
@@ -396,14 +494,16 @@ def display_video_generator(style: dict):
             if st.button("Generate Video"):
                 with st.spinner("Creating video..."):
                     try:
+                        generator = st.session_state.video_generator
+
                         # Update settings
-                        st.session_state.video_generator.update_settings(
+                        generator.update_settings(
                             style=style,
                             quality=quality
                         )
-                        
+
                         # Generate video
-                        video_bytes = st.session_state.video_generator.create_video(
+                        video_bytes = generator.create_video(
                             df[selected_cols],
                             selected_cols,
                             selected_charts,
@@ -425,11 +525,12 @@ def display_video_generator(style: dict):
                             st.error("Failed to generate video")
                             
                     except Exception as e:
+                        logger.exception("Error generating video")
                         st.error(f"Error generating video: {str(e)}")
-                        st.exception(e)
         else:
             st.warning("Please select at least one column and one chart type")
             
+@st.fragment
 def display_data_cleaning():
     """Display data cleaning page"""
     st.title("🧹 Data Cleaning")
@@ -437,7 +538,7 @@ def display_data_cleaning():
     if handle_file_upload():
         df = st.session_state.processed_data
         st.write("### Original Data Preview")
-        st.dataframe(df.head())
+        st.dataframe(_preview(df), use_container_width=True)
 
         cleaning_options = st.multiselect(
             "Select cleaning operations:",
@@ -446,33 +547,48 @@ def display_data_cleaning():
 
         if st.button("Clean Data"):
             with st.spinner("Cleaning data..."):
-                cleaned_df = df.copy()
-                
-                if "Remove duplicates" in cleaning_options:
-                    cleaned_df = st.session_state.data_cleaner.remove_duplicates(cleaned_df)
-                
-                if "Handle missing values" in cleaning_options:
-                    cleaned_df = st.session_state.data_cleaner.handle_missing_values(cleaned_df)
-                
-                if "Remove outliers" in cleaning_options:
-                    cleaned_df = st.session_state.data_cleaner.handle_outliers(cleaned_df)
-                
-                if "Normalize data" in cleaning_options:
-                    cleaned_df = st.session_state.data_cleaner.normalize_data(cleaned_df)
+                cleaner = st.session_state.data_cleaner
+
+                # One clean_data call runs all selected operations as a
+                # single pipeline: the frame is copied once instead of once
+                # per operation, and one report covers the whole run
+                operations = [
+                    op for op in cleaner.supported_operations
+                    if op in cleaning_options
+                ]
+                if operations:
+                    cleaned_df, _ = cleaner.clean_data(df, operations)
+                else:
+                    cleaned_df = df
 
                 st.success("Data cleaned successfully!")
                 st.write("### Cleaned Data Preview")
-                st.dataframe(cleaned_df.head())
-
-                # Download cleaned data
-                csv = cleaned_df.to_csv(index=False)
-                st.download_button(
-                    "Download Cleaned Data",
-                    csv,
-                    "cleaned_data.csv",
-                    "text/csv",
-                    key='download-csv'
-                )
+                st.dataframe(_preview(cleaned_df), use_container_width=True)
+
+                # Download cleaned data, compressed on the fly so the raw
+                # CSV string is never held in memory
+                csv_buf = io.BytesIO()
+                cleaned_df.to_csv(csv_buf, index=False, compression='gzip')
+                parquet_buf = io.BytesIO()
+                cleaned_df.to_parquet(parquet_buf, compression='zstd')
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.download_button(
+                        "Download as CSV (gzip)",
+                        csv_buf.getvalue(),
+                        "cleaned_data.csv.gz",
+                        "application/gzip",
+                        key='download-csv'
+                    )
+                with col2:
+                    st.download_button(
+                        "Download as Parquet",
+                        parquet_buf.getvalue(),
+                        "cleaned_data.parquet",
+                        "application/octet-stream",
+                        key='download-parquet'
+                    )
 
 def main():
     """Main application function"""
@@ -529,13 +645,12 @@ def main():
         
         # Get complete style configuration
         style = get_style(style_name)
-        
-        # Initialize style-dependent components
-        if st.session_state.visualizer is None or st.session_state.visualizer.style != style:
-            st.session_state.visualizer = Visualizer(style)
-        
-        if st.session_state.animation_generator is None or st.session_state.animation_generator.style != style:
-            st.session_state.animation_generator = AnimationGenerator(style)
+
+        # Style-dependent components are cached by style name, so changing
+        # any other widget does not rebuild them
+        st.session_state.style_name = style_name
+        st.session_state.visualizer = _visualizer(style_name)
+        st.session_state.animation_generator = _animation_generator(style_name)
 
     # Display selected page
     if page == "Home":
@@ -1,21 +1,32 @@
 import os
+import functools
 import warnings
 from dotenv import load_dotenv
 
+# Every installed filter entry is consulted on each warnings.warn() call, and
+# load_environment runs on every Streamlit rerun, so install a single filter
+# exactly once per process
+_WARNINGS_INSTALLED = False
+
+@functools.lru_cache(maxsize=1)
 def load_environment():
-    """Load environment variables and configure settings"""
+    """Load environment variables and configure settings
+
+    Cached so Streamlit reruns do not re-stat and re-parse .env each time.
+    """
     # Load environment variables
     load_dotenv()
-    
+
     # Configure environment variables
     os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'  # Suppress TF logging
     os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'  # Disable oneDNN custom operations
-    
+
     # Suppress warnings
-    warnings.filterwarnings('ignore', category=DeprecationWarning)
-    warnings.filterwarnings('ignore', category=FutureWarning)
-    warnings.filterwarnings('ignore', category=UserWarning)
-    
+    global _WARNINGS_INSTALLED
+    if not _WARNINGS_INSTALLED:
+        warnings.simplefilter('ignore')
+        _WARNINGS_INSTALLED = True
+
     # Check for required API keys
     api_key = os.getenv('GROQ_API_KEY')
     if not api_key:
@@ -4,10 +4,13 @@ import pandas as pd
 import numpy as np
 from typing import Tuple, Dict, Any
 import logging
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
 
 logger = logging.getLogger(__name__)
 
+# With copy-on-write, frames can share data until one side is actually
+# modified, so the cleaning pipeline no longer pays for eager full copies
+pd.set_option("mode.copy_on_write", True)
+
 class DataCleaner:
     """Class for cleaning and preprocessing data"""
     
@@ -15,6 +18,9 @@ class DataCleaner:
         self.original_df = None
         self.cleaned_df = None
         self.cleaning_report = {}
+        self._numeric_cols = None
+        self._categorical_cols = None
+        self._null_counts = None
         self.supported_operations = [
             "Remove duplicates",
             "Handle missing values",
@@ -28,8 +34,20 @@ class DataCleaner:
             if df is None or df.empty:
                 raise ValueError("DataFrame is empty or None")
 
-            self.original_df = df.copy()
-            self.cleaned_df = df.copy()
+            self.original_df = df
+            # Shallow copy: copy-on-write defers copying each block until
+            # an operation below actually writes to it
+            self.cleaned_df = df.copy(deep=False)
+            # Column dtypes do not change across the operations below, so
+            # resolve the column sets once for the whole run instead of
+            # re-running select_dtypes in each private method. 'number'
+            # also covers nullable and Arrow-backed numeric dtypes that
+            # an int64/float64 list would silently skip
+            self._numeric_cols = self.cleaned_df.select_dtypes(include='number').columns
+            self._categorical_cols = self.cleaned_df.select_dtypes(include=['object', 'category', 'string']).columns
+            # One null scan shared by the whole run; steps that drop rows
+            # invalidate it so later steps recount only when necessary
+            self._null_counts = self.cleaned_df.isnull().sum()
             self.cleaning_report = {
                 'original_shape': df.shape,
                 'operations': {},
@@ -93,7 +111,20 @@ class DataCleaner:
         """Remove duplicate rows"""
         try:
             initial_rows = len(self.cleaned_df)
-            self.cleaned_df = self.cleaned_df.drop_duplicates()
+
+            # A vectorized 64-bit row hash finds candidate duplicates near
+            # memory bandwidth; the exact comparison then runs only on rows
+            # whose hash repeats, so it stays collision-safe
+            row_hashes = pd.util.hash_pandas_object(self.cleaned_df, index=False)
+            hash_dupes = row_hashes.duplicated(keep=False).to_numpy()
+            if hash_dupes.any():
+                dup_within = self.cleaned_df[hash_dupes].duplicated().to_numpy()
+                keep = np.ones(initial_rows, dtype=bool)
+                keep[np.flatnonzero(hash_dupes)] = ~dup_within
+                self.cleaned_df = self.cleaned_df[keep]
+                # Dropped rows make the shared null counts stale
+                self._null_counts = None
+
             duplicates_removed = initial_rows - len(self.cleaned_df)
             
             self.cleaning_report['operations']['duplicates'] = {
@@ -113,33 +144,74 @@ class DataCleaner:
         try:
             strategy = getattr(self, 'missing_strategy', 'auto')
             missing_report = {}
-            
-            for column in self.cleaned_df.columns:
-                missing_count = self.cleaned_df[column].isnull().sum()
-                
-                if missing_count > 0:
-                    self.cleaning_report['columns_modified'].add(column)
-                    missing_report[column] = {
-                        'initial_missing': missing_count,
-                        'strategy_used': strategy
-                    }
-                    
-                    if strategy == 'auto':
-                        if pd.api.types.is_numeric_dtype(self.cleaned_df[column]):
-                            if missing_count / len(self.cleaned_df) < 0.05:
-                                self.cleaned_df[column].fillna(self.cleaned_df[column].mean(), inplace=True)
-                                missing_report[column]['strategy_used'] = 'mean'
-                            else:
-                                self.cleaned_df[column].fillna(self.cleaned_df[column].median(), inplace=True)
-                                missing_report[column]['strategy_used'] = 'median'
-                        else:
-                            mode_value = self.cleaned_df[column].mode()
-                            if not mode_value.empty:
-                                self.cleaned_df[column].fillna(mode_value[0], inplace=True)
-                                missing_report[column]['strategy_used'] = 'mode'
-                    
-                    missing_report[column]['remaining_missing'] = self.cleaned_df[column].isnull().sum()
-            
+
+            # One full scan for all null counts, then touch only the columns
+            # that actually have missing values
+            if self._null_counts is None:
+                self._null_counts = self.cleaned_df.isnull().sum()
+            null_counts = self._null_counts
+
+            # Fast path: a clean frame should make this step a no-op
+            # beyond the single scan above
+            if not null_counts.to_numpy().any():
+                self.cleaning_report['operations']['missing_values'] = missing_report
+                return
+
+            n_rows = len(self.cleaned_df)
+            cols_with_nulls = null_counts.index[null_counts > 0]
+
+            for column in cols_with_nulls:
+                missing_count = int(null_counts[column])
+                self.cleaning_report['columns_modified'].add(column)
+                missing_report[column] = {
+                    'initial_missing': missing_count,
+                    'strategy_used': strategy,
+                    # Overwritten below for every column that gets filled
+                    'remaining_missing': missing_count
+                }
+
+            if strategy == 'auto':
+                numeric_with_nulls = [
+                    column for column in cols_with_nulls
+                    if pd.api.types.is_numeric_dtype(self.cleaned_df[column])
+                ]
+                other_with_nulls = [
+                    column for column in cols_with_nulls
+                    if column not in numeric_with_nulls
+                ]
+
+                for column in numeric_with_nulls:
+                    # Fill on the raw ndarray: np.isnan + np.where skip
+                    # pandas' Block.fillna dispatch and its temporaries
+                    col_values = self.cleaned_df[column].to_numpy(dtype=np.float64)
+                    nan_mask = np.isnan(col_values)
+                    if int(null_counts[column]) / n_rows < 0.05:
+                        fill_value = np.nanmean(col_values)
+                        missing_report[column]['strategy_used'] = 'mean'
+                    else:
+                        fill_value = np.nanmedian(col_values)
+                        missing_report[column]['strategy_used'] = 'median'
+                    self.cleaned_df[column] = np.where(nan_mask, fill_value, col_values)
+
+                if other_with_nulls:
+                    # One column-parallel mode() and a single aligned
+                    # fillna replace the per-column mode loop
+                    modes = self.cleaned_df[other_with_nulls].mode(dropna=True)
+                    fills = modes.iloc[0].dropna() if len(modes) else pd.Series(dtype=object)
+                    if not fills.empty:
+                        filled_cols = list(fills.index)
+                        self.cleaned_df[filled_cols] = self.cleaned_df[filled_cols].fillna(fills)
+                        for column in filled_cols:
+                            missing_report[column]['strategy_used'] = 'mode'
+
+                # Recount over the touched columns rather than assuming
+                # zero: an all-NaN numeric column's nanmean/nanmedian is
+                # itself NaN, and a column with no mode gets no fill, so
+                # either can stay missing
+                remaining = self.cleaned_df[list(cols_with_nulls)].isnull().sum()
+                for column in cols_with_nulls:
+                    missing_report[column]['remaining_missing'] = int(remaining[column])
+
             self.cleaning_report['operations']['missing_values'] = missing_report
             
         except Exception as e:
@@ -152,35 +224,45 @@ class DataCleaner:
             method = getattr(self, 'outlier_method', 'zscore')
             threshold = getattr(self, 'outlier_threshold', 3.0)
             outliers_report = {}
-            numeric_columns = self.cleaned_df.select_dtypes(include=['int64', 'float64']).columns
-            
-            for column in numeric_columns:
-                if method == 'zscore':
-                    z_scores = np.abs((self.cleaned_df[column] - self.cleaned_df[column].mean()) 
-                                    / self.cleaned_df[column].std())
-                    outliers = self.cleaned_df[z_scores > threshold].index
-                elif method == 'iqr':
-                    Q1 = self.cleaned_df[column].quantile(0.25)
-                    Q3 = self.cleaned_df[column].quantile(0.75)
-                    IQR = Q3 - Q1
-                    outliers = self.cleaned_df[
-                        (self.cleaned_df[column] < (Q1 - 1.5 * IQR)) | 
-                        (self.cleaned_df[column] > (Q3 + 1.5 * IQR))
-                    ].index
-                else:
-                    raise ValueError(f"Unsupported outlier detection method: {method}")
-                
-                if len(outliers) > 0:
-                    self.cleaning_report['columns_modified'].add(column)
-                    outliers_report[column] = {
-                        'outliers_found': len(outliers),
-                        'percentage': (len(outliers) / len(self.cleaned_df)) * 100,
-                        'method': method,
-                        'threshold': threshold
-                    }
-                    
-                    self.cleaned_df.loc[outliers, column] = self.cleaned_df[column].median()
-            
+            numeric_columns = self._numeric_cols
+
+            if method not in ('zscore', 'iqr'):
+                raise ValueError(f"Unsupported outlier detection method: {method}")
+
+            if len(numeric_columns) > 0:
+                # One vectorized pass over the whole numeric matrix instead
+                # of a Python loop recomputing stats per column
+                values = self.cleaned_df[numeric_columns].to_numpy(dtype=np.float64)
+
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    if method == 'zscore':
+                        means = np.nanmean(values, axis=0)
+                        stds = np.nanstd(values, axis=0, ddof=1)
+                        outlier_mask = np.abs(values - means) / stds > threshold
+                        # Replacement medians are only worth the selection
+                        # pass when there is something to replace (the IQR
+                        # branch gets them free from its quantile batch)
+                        medians = np.nanmedian(values, axis=0) if outlier_mask.any() else None
+                    else:
+                        # Quartiles and replacement medians in one
+                        # introselect call instead of separate sorts
+                        q1, medians, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+                        iqr = q3 - q1
+                        outlier_mask = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+
+                for j, column in enumerate(numeric_columns):
+                    column_mask = outlier_mask[:, j]
+                    outliers_found = int(column_mask.sum())
+                    if outliers_found > 0:
+                        self.cleaning_report['columns_modified'].add(column)
+                        outliers_report[column] = {
+                            'outliers_found': outliers_found,
+                            'percentage': (outliers_found / len(self.cleaned_df)) * 100,
+                            'method': method,
+                            'threshold': threshold
+                        }
+                        self.cleaned_df.loc[column_mask, column] = medians[j]
+
             self.cleaning_report['operations']['outliers'] = outliers_report
             
         except Exception as e:
@@ -192,28 +274,48 @@ class DataCleaner:
         try:
             method = getattr(self, 'normalization_method', 'standard')
             normalize_report = {}
-            numeric_columns = self.cleaned_df.select_dtypes(include=['int64', 'float64']).columns
+            numeric_columns = self._numeric_cols
             
             if len(numeric_columns) > 0:
+                if method not in ('standard', 'minmax'):
+                    raise ValueError(f"Unsupported normalization method: {method}")
+
+                values = self.cleaned_df[numeric_columns].to_numpy(dtype=np.float64)
+                original_stats = self._describe_matrix(values, numeric_columns)
+
+                # Plain affine transform; the sklearn scalers run extra
+                # fit/transform passes and validation for the same arithmetic
                 if method == 'standard':
-                    scaler = StandardScaler()
-                elif method == 'minmax':
-                    scaler = MinMaxScaler()
+                    center = np.nanmean(values, axis=0)
+                    scale = np.nanstd(values, axis=0)
                 else:
-                    raise ValueError(f"Unsupported normalization method: {method}")
-                
-                original_stats = self.cleaned_df[numeric_columns].describe()
-                self.cleaned_df[numeric_columns] = scaler.fit_transform(self.cleaned_df[numeric_columns])
-                normalized_stats = self.cleaned_df[numeric_columns].describe()
-                
+                    center = np.nanmin(values, axis=0)
+                    scale = np.nanmax(values, axis=0) - center
+                # Constant columns map to zero, as with the sklearn scalers
+                scale = np.where(scale == 0, 1.0, scale)
+
+                self.cleaned_df[numeric_columns] = (values - center) / scale
+
+                # Normalization is affine, so the post-transform stats follow
+                # from the originals without rescanning the data
+                normalized_stats = {}
+                for j, column in enumerate(numeric_columns):
+                    col_stats = original_stats[column]
+                    normalized_stats[column] = {
+                        stat: (value if stat == 'count'
+                               else value / scale[j] if stat == 'std'
+                               else (value - center[j]) / scale[j])
+                        for stat, value in col_stats.items()
+                    }
+
                 normalize_report = {
                     'method': method,
                     'columns_normalized': len(numeric_columns),
                     'columns': list(numeric_columns),
-                    'original_stats': original_stats.to_dict(),
-                    'normalized_stats': normalized_stats.to_dict()
+                    'original_stats': original_stats,
+                    'normalized_stats': normalized_stats
                 }
-                
+
                 self.cleaning_report['columns_modified'].update(numeric_columns)
             
             self.cleaning_report['operations']['normalization'] = normalize_report
@@ -222,6 +324,25 @@ class DataCleaner:
             logger.error(f"Error normalizing data: {str(e)}")
             raise
 
+    @staticmethod
+    def _describe_matrix(values: np.ndarray, columns) -> Dict[str, Dict[str, float]]:
+        """Describe-style stats for a numeric matrix in one vectorized pass"""
+        quartiles = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+        stats = {
+            'count': (~np.isnan(values)).sum(axis=0).astype(float),
+            'mean': np.nanmean(values, axis=0),
+            'std': np.nanstd(values, axis=0, ddof=1),
+            'min': np.nanmin(values, axis=0),
+            '25%': quartiles[0],
+            '50%': quartiles[1],
+            '75%': quartiles[2],
+            'max': np.nanmax(values, axis=0)
+        }
+        return {
+            column: {stat: float(arr[j]) for stat, arr in stats.items()}
+            for j, column in enumerate(columns)
+        }
+
     def get_cleaning_report(self) -> Dict[str, Any]:
         """Get report of cleaning operations"""
         return self.cleaning_report
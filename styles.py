@@ -1,5 +1,7 @@
 # styles.py
 
+from functools import lru_cache
+
 STYLES = {
     'modern': {
         'background': '#1a1a1a',
@@ -135,24 +137,45 @@ COLOR_PALETTES = {
     ]
 }
 
-def get_style(style_name: str) -> dict:
-    """Get complete style configuration"""
-    if style_name not in STYLES:
-        raise ValueError(f"Unknown style: {style_name}")
-    
-    return {
-        **STYLES[style_name],
+# Merged once at import; get_style is called per figure update, so it
+# should be a dict lookup rather than rebuilding the merge every time.
+# Callers treat styles as read-only.
+_FULL_STYLES = {
+    name: {
+        **style,
         'chart_styles': CHART_STYLES,
         'animation_styles': ANIMATION_STYLES,
-        'color_palette': COLOR_PALETTES[style_name]
+        'color_palette': COLOR_PALETTES[name],
+        # Resolved once here so figure updates don't re-compare the
+        # background hex on every call
+        'plotly_template': 'plotly_dark' if style['background'] == '#000000' else 'plotly_white'
     }
+    for name, style in STYLES.items()
+}
+
+@lru_cache(maxsize=128)
+def hex_to_rgb(hex_color: str) -> tuple:
+    """Convert a '#rrggbb' color to an (r, g, b) int tuple, cached
+
+    The style dicts only ever use a handful of colors, so repeated
+    conversions in render paths hit the cache instead of re-parsing.
+    """
+    value = hex_color.lstrip('#')
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+def get_style(style_name: str) -> dict:
+    """Get complete style configuration"""
+    try:
+        return _FULL_STYLES[style_name]
+    except KeyError:
+        raise ValueError(f"Unknown style: {style_name}")
 
 def apply_style_to_figure(fig, style_name: str):
     """Apply style to a plotly figure"""
     style = get_style(style_name)
     
     fig.update_layout(
-        template='plotly_dark' if style['background'] == '#000000' else 'plotly_white',
+        template=style['plotly_template'],
         paper_bgcolor=style['background'],
         plot_bgcolor=style['background'],
         font=dict(
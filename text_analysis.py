@@ -1,68 +1,185 @@
-from groq import Groq
+from groq import Groq, AsyncGroq
+import asyncio
+import hashlib
+import httpx
+import threading
 import json
+from collections import OrderedDict
+
+# orjson's C parser is 2-5x faster than the stdlib on extraction
+# payloads and yields identical structures for this schema; fall back
+# transparently when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 class TextAnalyzer:
     """Class for analyzing text and creating visualizations"""
-    
+
+    # Extraction runs at temperature=0, so the same text always yields
+    # the same response; keep a bounded number of them to skip the
+    # network round trip on repeats
+    _CACHE_MAX_ENTRIES = 128
+
+    # Builder method names, resolved with getattr at dispatch: keeping
+    # the map at class level avoids rebuilding a dict of bound methods
+    # on every instance
+    _CHART_BUILDERS = {
+        'Bar Chart': '_create_bar_chart',
+        'Line Chart': '_create_line_chart',
+        'Pie Chart': '_create_pie_chart',
+        'Donut Chart': '_create_donut_chart',
+        'Area Chart': '_create_area_chart',
+        'Scatter Plot': '_create_scatter_plot',
+        'Funnel Chart': '_create_funnel_chart',
+        'Radar Chart': '_create_radar_chart',
+        'Treemap': '_create_treemap'
+    }
+
     def __init__(self, api_key: str):
-        self.client = Groq(api_key=api_key)
-        self.chart_types = {
-            'Bar Chart': self._create_bar_chart,
-            'Line Chart': self._create_line_chart,
-            'Pie Chart': self._create_pie_chart,
-            'Donut Chart': self._create_donut_chart,
-            'Area Chart': self._create_area_chart,
-            'Scatter Plot': self._create_scatter_plot,
-            'Funnel Chart': self._create_funnel_chart,
-            'Radar Chart': self._create_radar_chart,
-            'Treemap': self._create_treemap
-        }
+        # One long-lived connection pool shared across requests: without
+        # keepalive every call pays TCP + TLS setup (~50-200 ms) before
+        # any tokens flow
+        self._http = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+        )
+        self.client = Groq(api_key=api_key, http_client=self._http)
+        self._async_client = AsyncGroq(api_key=api_key)
+        self._extract_cache = OrderedDict()
+        # The instance is cache_resource-shared across session threads,
+        # so the cache's check/move_to_end/evict sequences need a lock;
+        # it only guards the dict operations, never an API call
+        self._cache_lock = threading.Lock()
+
+    @property
+    def chart_types(self) -> Dict[str, str]:
+        """Supported chart types, for callers listing the options"""
+        return self._CHART_BUILDERS
+
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self._http.close()
 
     def extract_data(self, text: str) -> Dict[str, Any]:
         """Extract numerical data from text using Groq AI"""
         try:
             prompt = self._create_extraction_prompt(text)
-            
+
+            # Content-addressed by model + prompt; hits skip the API call
+            cache_key = self._prompt_cache_key(prompt)
+            with self._cache_lock:
+                cached = self._extract_cache.get(cache_key)
+                if cached is not None:
+                    self._extract_cache.move_to_end(cache_key)
+                    return cached
+
             response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a data extraction expert. Extract numerical data and suggest visualizations."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=self._extraction_messages(prompt),
                 model="mixtral-8x7b-32768",
                 temperature=0
             )
-            
-            result = json.loads(response.choices[0].message.content)
+
+            result = _json_loads(response.choices[0].message.content)
+            self._cache_result(cache_key, result)
             return result
-            
+
         except Exception as e:
             logger.error(f"Error extracting data: {str(e)}")
             raise
 
+    async def extract_data_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Extract numerical data from many texts concurrently.
+
+        Cache hits (and duplicate texts within the batch) short-circuit
+        before any network call; the remaining requests are fired
+        concurrently, so a batch costs roughly one round trip instead of
+        one per text.
+        """
+        try:
+            prompts = [self._create_extraction_prompt(text) for text in texts]
+            keys = [self._prompt_cache_key(prompt) for prompt in prompts]
+
+            results = {}
+            pending = []
+            with self._cache_lock:
+                for key, prompt in zip(keys, prompts):
+                    cached = self._extract_cache.get(key)
+                    if cached is not None:
+                        self._extract_cache.move_to_end(key)
+                        results[key] = cached
+                    elif key not in results and all(key != k for k, _ in pending):
+                        pending.append((key, prompt))
+
+            async def fetch(key, prompt):
+                response = await self._async_client.chat.completions.create(
+                    messages=self._extraction_messages(prompt),
+                    model="mixtral-8x7b-32768",
+                    temperature=0
+                )
+                return key, _json_loads(response.choices[0].message.content)
+
+            for key, result in await asyncio.gather(*(fetch(k, p) for k, p in pending)):
+                self._cache_result(key, result)
+                results[key] = result
+
+            return [results[key] for key in keys]
+
+        except Exception as e:
+            logger.error(f"Error extracting data batch: {str(e)}")
+            raise
+
+    @staticmethod
+    def _extraction_messages(prompt: str) -> list:
+        """Chat payload shared by the sync and async extraction paths"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a data extraction expert. Extract numerical data and suggest visualizations."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    @staticmethod
+    def _prompt_cache_key(prompt: str) -> str:
+        """Content-address a prompt by model + text"""
+        return hashlib.sha256(f"mixtral-8x7b-32768\x00{prompt}".encode()).hexdigest()
+
+    def _cache_result(self, cache_key: str, result: Dict[str, Any]):
+        """Store a parsed extraction, evicting the least recently used"""
+        with self._cache_lock:
+            self._extract_cache[cache_key] = result
+            if len(self._extract_cache) > self._CACHE_MAX_ENTRIES:
+                self._extract_cache.popitem(last=False)
+
     def create_visualization(self, 
                            data: Dict[str, Any], 
                            chart_type: str,
                            style: Optional[Dict[str, Any]] = None) -> go.Figure:
         """Create visualization based on chart type"""
         try:
-            if chart_type not in self.chart_types:
+            if chart_type not in self._CHART_BUILDERS:
                 raise ValueError(f"Unsupported chart type: {chart_type}")
-            
+
             df = pd.DataFrame(data['data_points'])
-            fig = self.chart_types[chart_type](df)
+            # The title lives on the extraction payload, not the
+            # data-points frame: looking it up there was a pandas column
+            # lookup per chart that would even return a column named
+            # 'title' if one existed
+            title = data.get('title', 'Data Analysis')
+            fig = getattr(self, self._CHART_BUILDERS[chart_type])(df, title)
             
             # Apply styling if provided
             if style:
@@ -102,89 +219,89 @@ class TextAnalyzer:
         }}
         """
 
-    def _create_bar_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _create_bar_chart(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create bar chart"""
         return px.bar(
             df,
             x='label',
             y='value',
-            title=df.get('title', 'Data Analysis'),
+            title=title,
             text='value'
         )
 
-    def _create_line_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _create_line_chart(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create line chart"""
         return px.line(
             df,
             x='label',
             y='value',
-            title=df.get('title', 'Data Analysis'),
+            title=title,
             markers=True
         )
 
-    def _create_pie_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _create_pie_chart(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create pie chart"""
         return px.pie(
             df,
             values='value',
             names='label',
-            title=df.get('title', 'Data Analysis')
+            title=title
         )
 
-    def _create_donut_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _create_donut_chart(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create donut chart"""
         return px.pie(
             df,
             values='value',
             names='label',
-            title=df.get('title', 'Data Analysis'),
+            title=title,
             hole=0.5
         )
 
-    def _create_area_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _create_area_chart(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create area chart"""
         return px.area(
             df,
             x='label',
             y='value',
-            title=df.get('title', 'Data Analysis')
+            title=title
         )
 
-    def _create_scatter_plot(self, df: pd.DataFrame) -> go.Figure:
+    def _create_scatter_plot(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create scatter plot"""
         return px.scatter(
             df,
             x='label',
             y='value',
-            title=df.get('title', 'Data Analysis'),
+            title=title,
             size='value'
         )
 
-    def _create_funnel_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _create_funnel_chart(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create funnel chart"""
         fig = go.Figure(go.Funnel(
             y=df['label'],
             x=df['value'],
             textinfo="value+percent initial"
         ))
-        fig.update_layout(title=df.get('title', 'Data Analysis'))
+        fig.update_layout(title=title)
         return fig
 
-    def _create_radar_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _create_radar_chart(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create radar chart"""
         fig = go.Figure(go.Scatterpolar(
             r=df['value'],
             theta=df['label'],
             fill='toself'
         ))
-        fig.update_layout(title=df.get('title', 'Data Analysis'))
+        fig.update_layout(title=title)
         return fig
 
-    def _create_treemap(self, df: pd.DataFrame) -> go.Figure:
+    def _create_treemap(self, df: pd.DataFrame, title: str) -> go.Figure:
         """Create treemap"""
         return px.treemap(
             df,
             path=['label'],
             values='value',
-            title=df.get('title', 'Data Analysis')
+            title=title
         )
\ No newline at end of file
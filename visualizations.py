@@ -1,6 +1,9 @@
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import hashlib
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional
@@ -8,20 +11,101 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Above this many rows, traces are downsampled before being handed to
+# Plotly: the browser-side renderer is O(points per trace) and stalls
+# well before 50k, while ~3k well-chosen points are visually identical
+MAX_TRACE_POINTS = 3000
+
+# Frames past this size render their line/scatter traces through WebGL
+# (go.Scattergl) instead of SVG: the GPU handles dense marker clouds
+# that make the SVG DOM crawl. Only plain lines/markers modes go
+# through it; filled area traces stay on SVG.
+WEBGL_THRESHOLD_POINTS = 5000
+
+
+def _lttb_indices(y, n_out):
+    """Pick n_out visually representative row indices.
+
+    Largest-Triangle-Three-Buckets: the series is split into n_out - 2
+    buckets and each bucket keeps the point forming the largest triangle
+    with the previous pick and the next bucket's average, which preserves
+    spikes and extremes that stride sampling would drop. Row position
+    stands in for x, so the caller can index any column (or the index)
+    with the result.
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=np.float64)
+    # First and last rows are always kept; buckets cover the interior
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        # The next bucket's average stands in for its eventual pick
+        if i + 2 < n_out - 1:
+            nlo, nhi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+        else:
+            nlo, nhi = n - 1, n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = np.nanmean(y[nlo:nhi])
+
+        areas = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev])
+                       - (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        # NaN candidates never win over any real point
+        prev = lo + int(np.nan_to_num(areas, nan=-1.0).argmax())
+        indices[i + 1] = prev
+
+    return indices
+
+
 class Visualizer:
     """Class for handling data visualizations"""
-    
+
+    # Chart construction is deterministic in the data, so rebuilt charts
+    # (style toggles, page reruns) can come from a small LRU instead
+    _FIG_CACHE_MAX_ENTRIES = 32
+
+    # Builder method names, resolved with getattr at dispatch: keeping
+    # the map at class level avoids rebuilding a dict of bound methods
+    # on every instance
+    _CHART_BUILDERS = {
+        'Line Plot': '_create_line_plot',
+        'Bar Chart': '_create_bar_chart',
+        'Scatter Plot': '_create_scatter_plot',
+        'Area Chart': '_create_area_chart',
+        'Box Plot': '_create_box_plot',
+        'Violin Plot': '_create_violin_plot',
+        'Heatmap': '_create_heatmap'
+    }
+
     def __init__(self, style: Dict[str, Any]):
         self.style = style
-        self.chart_types = {
-            'Line Plot': self._create_line_plot,
-            'Bar Chart': self._create_bar_chart,
-            'Scatter Plot': self._create_scatter_plot,
-            'Area Chart': self._create_area_chart,
-            'Box Plot': self._create_box_plot,
-            'Violin Plot': self._create_violin_plot,
-            'Heatmap': self._create_heatmap
-        }
+        self._fig_cache = OrderedDict()
+        self._stats_cache = OrderedDict()
+        # Instances are cache_resource-shared across session threads, so
+        # the check/move_to_end/evict sequences on the LRUs need a lock;
+        # it only covers the dict operations, never a chart build
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _frame_digest(df: pd.DataFrame) -> bytes:
+        """Content-address a frame: blake2b over the per-row pandas
+        hashes runs at memory speed and dwarfs what it guards"""
+        return hashlib.blake2b(
+            pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes(),
+            digest_size=16
+        ).digest()
+
+    @property
+    def chart_types(self) -> Dict[str, str]:
+        """Supported chart types, for callers listing the options"""
+        return self._CHART_BUILDERS
 
     def create_visualization(self, 
                            df: pd.DataFrame, 
@@ -29,11 +113,29 @@ class Visualizer:
                            title: Optional[str] = None) -> go.Figure:
         """Create visualization based on chart type"""
         try:
-            if chart_type not in self.chart_types:
+            if chart_type not in self._CHART_BUILDERS:
                 raise ValueError(f"Unsupported chart type: {chart_type}")
-            
-            fig = self.chart_types[chart_type](df)
-            
+
+            key = (self._frame_digest(df), tuple(df.columns), chart_type)
+
+            with self._cache_lock:
+                cached = self._fig_cache.get(key)
+                if cached is not None:
+                    self._fig_cache.move_to_end(key)
+            if cached is None:
+                # Built outside the lock: two sessions may race to build
+                # the same figure, which only costs a duplicate build
+                cached = getattr(self, self._CHART_BUILDERS[chart_type])(df)
+                with self._cache_lock:
+                    self._fig_cache[key] = cached
+                    if len(self._fig_cache) > self._FIG_CACHE_MAX_ENTRIES:
+                        self._fig_cache.popitem(last=False)
+
+            # Clone before styling so callers can mutate their figure
+            # without touching the cached copy; the layout below (title
+            # included) is fully reapplied on every call
+            fig = go.Figure(cached)
+
             # Apply common styling
             fig.update_layout(
                 template='plotly_dark' if self.style['background'] == '#000000' else 'plotly_white',
@@ -54,36 +156,52 @@ class Visualizer:
     def _create_line_plot(self, df: pd.DataFrame) -> go.Figure:
         """Create line plot"""
         fig = go.Figure()
-        
+        trace_cls = go.Scattergl if len(df) > WEBGL_THRESHOLD_POINTS else go.Scatter
+
         for column in df.columns:
+            x, y = self._downsample(df, column)
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df[column],
+                trace_cls(
+                    x=x,
+                    y=y,
                     name=column,
                     mode='lines+markers',
                     line=dict(width=2),
                     marker=dict(size=6)
                 )
             )
-        
+
         return fig
 
+    def _downsample(self, df: pd.DataFrame, column) -> tuple:
+        """Return (index, values) for a column, LTTB-downsampled when large"""
+        if len(df) <= MAX_TRACE_POINTS:
+            return df.index, df[column]
+        idx = _lttb_indices(df[column].to_numpy(dtype=np.float64), MAX_TRACE_POINTS)
+        return df.index[idx], df[column].iloc[idx]
+
     def _create_bar_chart(self, df: pd.DataFrame) -> go.Figure:
         """Create bar chart"""
         fig = go.Figure()
-        
-        for column in df.columns:
+
+        # One vectorized round over the whole block instead of a Series
+        # allocation per column; handing Plotly ndarrays also skips its
+        # per-trace Series conversion
+        values = df.to_numpy()
+        rounded = np.round(values, 2)
+        index = df.index.to_numpy()
+
+        for j, column in enumerate(df.columns):
             fig.add_trace(
                 go.Bar(
-                    x=df.index,
-                    y=df[column],
+                    x=index,
+                    y=values[:, j],
                     name=column,
-                    text=df[column].round(2),
+                    text=rounded[:, j],
                     textposition='auto',
                 )
             )
-        
+
         return fig
 
     def _create_scatter_plot(self, df: pd.DataFrame) -> go.Figure:
@@ -92,22 +210,28 @@ class Visualizer:
             raise ValueError("Scatter plot requires at least two columns")
             
         fig = go.Figure()
-        
+
+        # Downsample on the y column; the picked rows index x and the
+        # hover text alike
+        rows = _lttb_indices(df[df.columns[1]].to_numpy(dtype=np.float64),
+                             MAX_TRACE_POINTS) if len(df) > MAX_TRACE_POINTS else slice(None)
+        trace_cls = go.Scattergl if len(df) > WEBGL_THRESHOLD_POINTS else go.Scatter
+
         fig.add_trace(
-            go.Scatter(
-                x=df[df.columns[0]],
-                y=df[df.columns[1]],
+            trace_cls(
+                x=df[df.columns[0]].iloc[rows],
+                y=df[df.columns[1]].iloc[rows],
                 mode='markers',
                 marker=dict(
                     size=10,
                     color=self.style['accent'],
                     line=dict(width=1)
                 ),
-                text=df.index,
+                text=df.index[rows],
                 name='Data Points'
             )
         )
-        
+
         return fig
 
     def _create_area_chart(self, df: pd.DataFrame) -> go.Figure:
@@ -115,17 +239,18 @@ class Visualizer:
         fig = go.Figure()
         
         for column in df.columns:
+            x, y = self._downsample(df, column)
             fig.add_trace(
                 go.Scatter(
-                    x=df.index,
-                    y=df[column],
+                    x=x,
+                    y=y,
                     name=column,
                     fill='tonexty',
                     mode='lines',
                     line=dict(width=0.5)
                 )
             )
-        
+
         return fig
 
     def _create_box_plot(self, df: pd.DataFrame) -> go.Figure:
@@ -159,29 +284,61 @@ class Visualizer:
         
         return fig
 
+    def _corr_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """Compute the correlation matrix as a plain ndarray.
+
+        float32 halves the bytes through the BLAS matmul behind
+        corrcoef; the display rounds to two decimals anyway. Frames
+        with NaNs keep pandas' pairwise-complete handling.
+        """
+        arr = df.to_numpy(dtype=np.float32)
+        if np.isnan(arr).any():
+            return df.corr().to_numpy()
+        return np.corrcoef(arr, rowvar=False)
+
     def _create_heatmap(self, df: pd.DataFrame) -> go.Figure:
         """Create correlation heatmap"""
-        corr_matrix = df.corr()
-        
+        columns = list(df.columns)
+        corr = self._corr_matrix(df)
+
+        # Per-cell annotations dominate render time on wide matrices
+        annotate = len(columns) <= 15
+
         fig = go.Figure(
             data=go.Heatmap(
-                z=corr_matrix,
-                x=corr_matrix.columns,
-                y=corr_matrix.columns,
+                z=corr,
+                x=columns,
+                y=columns,
                 colorscale='RdBu',
                 zmin=-1,
                 zmax=1,
-                text=corr_matrix.round(2),
-                texttemplate='%{text}',
+                text=np.round(corr, 2) if annotate else None,
+                texttemplate='%{text}' if annotate else None,
                 textfont={"size": 10},
                 hoverongaps=False
             )
         )
-        
+
         return fig
 
     def create_dashboard(self, df: pd.DataFrame) -> go.Figure:
         """Create a dashboard with multiple visualizations"""
+        # Correlations and describe() are both O(columns x rows) and
+        # deterministic in the data, so re-dashboarding the same frame
+        # (style changes, page reruns) reuses the cached pair
+        key = (self._frame_digest(df), tuple(df.columns))
+        with self._cache_lock:
+            cached = self._stats_cache.get(key)
+            if cached is not None:
+                self._stats_cache.move_to_end(key)
+        if cached is None:
+            cached = (self._corr_matrix(df), df.describe().round(2))
+            with self._cache_lock:
+                self._stats_cache[key] = cached
+                if len(self._stats_cache) > self._FIG_CACHE_MAX_ENTRIES:
+                    self._stats_cache.popitem(last=False)
+        corr, stats = cached
+
         fig = make_subplots(
             rows=2, 
             cols=2,
@@ -202,20 +359,20 @@ class Visualizer:
                 row=1, col=2
             )
         
-        # Add correlation heatmap
-        corr_matrix = df.corr()
+        # Add correlation heatmap; the ndarray feeds Plotly directly
+        # with no intermediate DataFrame
+        columns = list(df.columns)
         fig.add_trace(
             go.Heatmap(
-                z=corr_matrix,
-                x=corr_matrix.columns,
-                y=corr_matrix.columns,
+                z=corr,
+                x=columns,
+                y=columns,
                 colorscale='RdBu'
             ),
             row=2, col=1
         )
-        
+
         # Add statistics table
-        stats = df.describe().round(2)
         fig.add_trace(
             go.Table(
                 header=dict(values=['Statistic'] + list(stats.columns)),